@@ -145,16 +145,20 @@ def list_projects():
     """List all Probaah projects in current directory"""
     
     projects = []
-    for item in os.listdir("."):
-        if os.path.isdir(item) and os.path.exists(f"{item}/.probaah-config.yaml"):
+    # scandir reports the entry type from the directory listing itself,
+    # so files are skipped without a stat() per entry
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if not entry.is_dir() or not os.path.exists(f"{entry.name}/.probaah-config.yaml"):
+                continue
             try:
-                with open(f"{item}/.probaah-config.yaml", "r") as f:
+                with open(f"{entry.name}/.probaah-config.yaml", "r") as f:
                     config = yaml.safe_load(f)
                     projects.append({
                         "name": config["project"]["name"],
                         "type": config["project"]["type"],
                         "created": config["project"]["created"][:10],  # Just date
-                        "folder": item
+                        "folder": entry.name
                     })
             except:
                 continue
@@ -328,13 +332,12 @@ def render():
 @click.option("--rdf/--no-rdf", default=True, help="Calculate RDF")
 @click.option("--energy/--no-energy", default=True, help="Analyze energy")
 @click.option("--plots/--no-plots", default=True, help="Generate plots")
-def analyze_trajectory(trajectory_file, output_dir, bonds, rdf, energy, plots):
+@click.option("--stream", is_flag=True, help="Stream frames instead of loading the whole trajectory")
+def analyze_trajectory(trajectory_file, output_dir, bonds, rdf, energy, plots, stream):
     """Comprehensive trajectory analysis using ASE"""
     try:
         # Import the analyzer
-        import sys
-        sys.path.append('plugins/analysis/ase_tools')
-        from trajectory_analyzer import analyze_trajectory_cli
+        from plugins.analysis.ase_tools.trajectory_analyzer import analyze_trajectory_cli
         
         console.print(f"🔬 [bold]Analyzing trajectory:[/bold] {trajectory_file}")
         
@@ -344,7 +347,8 @@ def analyze_trajectory(trajectory_file, output_dir, bonds, rdf, energy, plots):
             bonds=bonds,
             rdf=rdf,
             energy=energy,
-            plots=plots
+            plots=plots,
+            stream=stream
         )
         
         console.print("✅ [bold green]Analysis complete![/bold green]")
@@ -369,9 +373,7 @@ def analyze_trajectory(trajectory_file, output_dir, bonds, rdf, energy, plots):
 def analyze_bonds_only(trajectory_file, cutoff, output):
     """Quick bond analysis only"""
     try:
-        import sys
-        sys.path.append('plugins/analysis/ase_tools')
-        from trajectory_analyzer import ProbaahTrajectoryAnalyzer
+        from plugins.analysis.ase_tools.trajectory_analyzer import ProbaahTrajectoryAnalyzer
         
         console.print(f"🔗 [bold]Bond analysis:[/bold] {trajectory_file}")
         
@@ -394,9 +396,7 @@ def analyze_bonds_only(trajectory_file, cutoff, output):
 def create_presentation(analysis_dir, title, output, style):
     """Create automated research presentation"""
     try:
-        import sys
-        sys.path.append('plugins/presentation/pptx_generator')
-        from research_slides import generate_presentation_cli
+        from plugins.presentation.pptx_generator.research_slides import generate_presentation_cli
         
         console.print(f"🎨 [bold]Creating presentation:[/bold] {title}")
         
@@ -416,6 +416,32 @@ def create_presentation(analysis_dir, title, output, style):
     except Exception as e:
         console.print(f"❌ [red]Presentation creation failed: {e}[/red]")
 
+@presentation.command("batch")
+@click.argument("analysis_dirs", nargs=-1, required=True)
+@click.option("--output-dir", default=None, help="Directory for the presentations")
+@click.option("--workers", default=None, type=int, help="Parallel worker processes")
+def batch_presentations(analysis_dirs, output_dir, workers):
+    """Create weekly update presentations for several analysis directories"""
+    try:
+        from plugins.presentation.pptx_generator.research_slides import create_presentations_batch
+
+        console.print(f"🎨 [bold]Creating {len(analysis_dirs)} presentations[/bold]")
+
+        output_files = create_presentations_batch(
+            analysis_dirs=list(analysis_dirs),
+            output_dir=output_dir,
+            max_workers=workers
+        )
+
+        for output_file in output_files:
+            console.print(f"✅ {output_file}")
+
+    except ImportError as e:
+        console.print(f"❌ [red]Error importing presentation generator: {e}[/red]")
+        console.print("💡 Make sure python-pptx is installed: pip install python-pptx")
+    except Exception as e:
+        console.print(f"❌ [red]Batch presentation creation failed: {e}[/red]")
+
 @presentation.command("weekly")
 @click.option("--project-dir", default=".", help="Project directory")
 @click.option("--title", default=None, help="Custom title")
@@ -452,9 +478,7 @@ def weekly_update(project_dir, title):
         date_str = datetime.now().strftime("%Y%m%d")
         output_file = f"weekly_update_{date_str}.pptx"
         
-        import sys
-        sys.path.append('plugins/presentation/pptx_generator')
-        from research_slides import create_weekly_update_presentation
+        from plugins.presentation.pptx_generator.research_slides import create_weekly_update_presentation
         
         result = create_weekly_update_presentation(analysis_dir, output_file, title)
         console.print(f"✅ [bold green]Weekly update created:[/bold green] {result}")
@@ -471,8 +495,6 @@ def weekly_update(project_dir, title):
 def render_trajectory(trajectory_file, output, frames, style):
     """Render trajectory as video using ASE"""
     try:
-        import sys
-        sys.path.append('plugins/analysis/ase_tools')
         from ase.io import read
         from ase.visualize.plot import plot_atoms
         import matplotlib.pyplot as plt
@@ -517,9 +539,7 @@ def full_workflow(trajectory_file, title):
     # Step 1: Analysis
     console.print("\n📊 Step 1: Trajectory Analysis")
     try:
-        import sys
-        sys.path.append('plugins/analysis/ase_tools')
-        from trajectory_analyzer import analyze_trajectory_cli
+        from plugins.analysis.ase_tools.trajectory_analyzer import analyze_trajectory_cli
         
         results = analyze_trajectory_cli(trajectory_file, bonds=True, rdf=True, energy=True, plots=True)
         console.print("✅ Analysis complete")
@@ -531,9 +551,7 @@ def full_workflow(trajectory_file, title):
     # Step 2: Presentation
     console.print("\n🎨 Step 2: Presentation Generation")
     try:
-        import sys
-        sys.path.append('plugins/presentation/pptx_generator')
-        from research_slides import create_weekly_update_presentation
+        from plugins.presentation.pptx_generator.research_slides import create_weekly_update_presentation
         
         analysis_dir = Path(trajectory_file).parent / "analysis"
         output_file = f"{title.replace(' ', '_')}_presentation.pptx"
@@ -0,0 +1,77 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled RDF pair-histogram kernel for Probaah
+Same pairs and binning as _rdf_histogram_numba in trajectory_analyzer;
+built by setup.py when Cython is available
+"""
+
+import numpy as np
+
+from cython.parallel cimport prange, threadid
+from libc.math cimport rint, sqrt
+from libc.stdint cimport int64_t
+
+# setup.py drops -fopenmp for compilers without OpenMP; prange then runs
+# serially and a single histogram row is enough
+cdef extern from *:
+    """
+    #ifdef _OPENMP
+    #include <omp.h>
+    #else
+    static int omp_get_max_threads(void) { return 1; }
+    #endif
+    """
+    int omp_get_max_threads() nogil
+
+def rdf_histogram(const double[:, ::1] positions, const int64_t[::1] idx1,
+                  const int64_t[::1] idx2, bint triangle, const double[::1] box,
+                  double rmax, int n_bins):
+    """
+    Histogram of pair distances below rmax, without materializing them
+    
+    Pairs are (idx1[a], idx2[b]) with i != j, and only b > a when triangle
+    is set (all unique pairs). Rows of idx1 are shared out dynamically over
+    OpenMP threads, each filling its own histogram row; rows are summed at
+    the end.
+    
+    Args:
+        positions: Atom positions (C-contiguous float64)
+        idx1: First atom index set (int64)
+        idx2: Second atom index set (int64)
+        triangle: Count each pair once (idx1 and idx2 are the same set)
+        box: Per-axis box length for minimum-image wrapping (0 = not periodic)
+        rmax: Maximum distance
+        n_bins: Number of uniform bins over [0, rmax)
+    
+    Returns:
+        Pair counts per bin (int64)
+    """
+    cdef int n_threads = omp_get_max_threads()
+    hist = np.zeros((n_threads, n_bins), dtype=np.int64)
+    cdef int64_t[:, ::1] thread_hist = hist
+    cdef Py_ssize_t n1 = idx1.shape[0]
+    cdef Py_ssize_t n2 = idx2.shape[0]
+    cdef Py_ssize_t a, b, k, start, bin_idx
+    cdef int64_t i, j
+    cdef double rmax2 = rmax * rmax
+    cdef double inv_dr = n_bins / rmax
+    cdef double d, r2
+    
+    for a in prange(n1, nogil=True, schedule='dynamic', num_threads=n_threads):
+        i = idx1[a]
+        start = a + 1 if triangle else 0
+        for b in range(start, n2):
+            j = idx2[b]
+            if i == j:
+                continue
+            r2 = 0.0
+            for k in range(3):
+                d = positions[j, k] - positions[i, k]
+                if box[k] > 0.0:
+                    d = d - box[k] * rint(d / box[k])
+                r2 = r2 + d * d
+            if r2 < rmax2:
+                bin_idx = <Py_ssize_t>(sqrt(r2) * inv_dr)
+                if bin_idx < n_bins:
+                    thread_hist[threadid(), bin_idx] += 1
+    return hist.sum(axis=0)
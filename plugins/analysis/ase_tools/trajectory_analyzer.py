@@ -9,102 +9,814 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
 import json
+import os
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import combinations_with_replacement, islice
+from scipy.spatial.distance import pdist, cdist
 
-from ase.io import read, write
+from ase.io import iread, read, ulm, write
 from ase import Atoms
 from ase.geometry import get_distances
-from ase.neighborlist import NeighborList
-from ase.data import covalent_radii, atomic_numbers
+from ase.neighborlist import neighbor_list as ase_neighbor_list
+from ase.data import covalent_radii, atomic_numbers, chemical_symbols
 from ase.visualize.plot import plot_atoms
 
+try:
+    from matscipy.neighbours import neighbour_list
+except ImportError:
+    neighbour_list = None
+
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:
+    numba = None
+
+try:
+    import cupy as cp
+except Exception:
+    # Not installed, or installed without a usable CUDA toolkit
+    cp = None
+
+try:
+    # Compiled by setup.py when Cython is installed
+    from ._rdf_kernel import rdf_histogram as _rdf_histogram_cython
+except ImportError:
+    _rdf_histogram_cython = None
+
+# Per-atom skin ase.neighborlist.NeighborList adds to each cutoff by default;
+# part of the bond criterion, so both neighbour searches add it
+NEIGHBOR_SKIN = 0.3
+
+# Margin the bond neighbour list is built with beyond the bond cutoff, so
+# it can be reused until an atom has moved half of it
+VERLET_SKIN = 0.3
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Whether CuPy sees a CUDA device and can compile the RDF kernel"""
+    if cp is None:
+        return False
+    try:
+        if cp.cuda.runtime.getDeviceCount() < 1:
+            return False
+        _rdf_cuda_kernel.compile()
+    except Exception:
+        return False
+    return True
+
+def _rdf_backend() -> str:
+    """
+    RDF pair-histogram backend: PROBAAH_RDF_BACKEND ('cuda', 'cython',
+    'numba' or 'numpy')
+    
+    Defaults to 'cython'; 'cuda' is opt-in. A backend that can't run here
+    falls back to the next: cuda -> cython -> numba -> numpy.
+    """
+    backend = os.environ.get('PROBAAH_RDF_BACKEND', 'cython').lower()
+    if backend == 'cuda' and not _cuda_available():
+        backend = 'cython'
+    if backend == 'cython' and _rdf_histogram_cython is None:
+        backend = 'numba'
+    if backend == 'numba' and numba is None:
+        backend = 'numpy'
+    return backend
+
+def _orthorhombic_box(cell: np.ndarray, pbc: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Box lengths for minimum-image wrapping in the compiled RDF kernels
+    
+    Args:
+        cell: 3x3 cell matrix
+        pbc: Periodicity per axis
+        
+    Returns:
+        Per-axis box length (0 for non-periodic axes), or None for
+        triclinic periodic cells, which the kernel doesn't handle
+    """
+    if pbc.any() and np.count_nonzero(cell - np.diag(np.diag(cell))):
+        return None
+    return np.where(pbc, np.diag(cell), 0.0)
+
+def _map_frames(func, frames: Iterable, max_workers: Optional[int] = None) -> Iterator:
+    """
+    Thread-pool map over frames, in order, with a bounded number in flight
+    
+    Unlike Executor.map, frames are pulled from the iterable only as
+    results are consumed, so a streamed trajectory is never held in memory.
+    
+    Args:
+        func: Per-frame function
+        frames: Frame inputs (may be a generator)
+        max_workers: Threads (default: CPU count)
+        
+    Yields:
+        func(frame) for each frame
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for frame in frames:
+            pending.append(executor.submit(func, frame))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+# energy=<value> in an (ext)xyz comment line, as read by ase's extxyz reader
+_ENERGY_FIELD = re.compile(r'(?:^|\s)energy=(?:"([^"]*)"|(\S+))')
+
+def _read_xyz_energies(path: Path) -> np.ndarray:
+    """Energies from the comment line of each frame of an (ext)xyz file"""
+    energies = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            n_atoms = int(line)
+            match = _ENERGY_FIELD.search(next(f))
+            energies.append(float(match.group(1) or match.group(2)) if match else np.nan)
+            deque(islice(f, n_atoms), maxlen=0)  # Skip the atom lines unparsed
+    return np.array(energies)
+
+def _read_traj_energies(path: Path) -> np.ndarray:
+    """Energies from the calculator record of each frame of an ASE .traj file"""
+    energies = []
+    with ulm.open(str(path)) as reader:
+        for index in range(len(reader)):
+            calculator = reader[index].get('calculator')
+            energy = calculator.get('energy') if calculator is not None else None
+            energies.append(np.nan if energy is None else energy)
+    return np.array(energies, dtype=float)
+
+def _read_energies(path: Path) -> Optional[np.ndarray]:
+    """
+    Read per-frame potential energies without building Atoms objects
+    
+    Args:
+        path: Trajectory file
+        
+    Returns:
+        Energy per frame (NaN where missing), or None for formats without a
+        direct reader or files it can't parse
+    """
+    suffix = path.suffix.lower()
+    try:
+        if suffix in ('.xyz', '.extxyz'):
+            return _read_xyz_energies(path)
+        if suffix == '.traj':
+            return _read_traj_energies(path)
+    except (ValueError, StopIteration, KeyError, AttributeError, ulm.InvalidULMFileError):
+        # Includes old-format (non-ULM) .traj files
+        return None
+    return None
+
+def _frame_energy(atoms: Atoms) -> float:
+    """Potential energy of a frame, or NaN if it has none"""
+    try:
+        return atoms.get_potential_energy()
+    except:
+        # Energy not available in this frame
+        return np.nan
+
+if numba is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rdf_histogram_numba(positions, idx1, idx2, triangle, box, rmax, n_bins,
+                             n_threads):
+        """
+        Histogram of pair distances below rmax, without materializing them
+        
+        Pairs are (idx1[a], idx2[b]) with i != j, and only b > a when
+        triangle is set (all unique pairs). Each thread fills its own
+        histogram row over a strided share of idx1; rows are summed at the end.
+        """
+        hist = np.zeros((n_threads, n_bins), dtype=np.int64)
+        rmax2 = rmax * rmax
+        inv_dr = n_bins / rmax
+        n1 = idx1.shape[0]
+        n2 = idx2.shape[0]
+        for t in prange(n_threads):
+            for a in range(t, n1, n_threads):
+                i = idx1[a]
+                start = a + 1 if triangle else 0
+                for b in range(start, n2):
+                    j = idx2[b]
+                    if i == j:
+                        continue
+                    r2 = 0.0
+                    for k in range(3):
+                        d = positions[j, k] - positions[i, k]
+                        if box[k] > 0.0:
+                            d -= box[k] * np.round(d / box[k])
+                        r2 += d * d
+                    if r2 < rmax2:
+                        bin_idx = int(np.sqrt(r2) * inv_dr)
+                        if bin_idx < n_bins:
+                            hist[t, bin_idx] += 1
+        return hist.sum(axis=0)
+
+# Pair-histogram kernel for the CUDA backend. Same pairs and binning as
+# _rdf_histogram_numba; threads take pairs grid-stride and count into a
+# per-block shared-memory histogram that is added to the global one at the end.
+_RDF_CUDA_SOURCE = r'''
+extern "C" __global__
+void rdf_histogram(const double* positions, const long long* idx1, const long long* idx2,
+                   const int n1, const int n2, const int triangle, const double* box,
+                   const double rmax, const int n_bins, unsigned long long* hist)
+{
+    extern __shared__ unsigned int block_hist[];
+    for (int b = threadIdx.x; b < n_bins; b += blockDim.x)
+        block_hist[b] = 0;
+    __syncthreads();
+
+    const double rmax2 = rmax * rmax;
+    const double inv_dr = n_bins / rmax;
+    const long long n_pairs = (long long)n1 * n2;
+    for (long long p = (long long)blockIdx.x * blockDim.x + threadIdx.x; p < n_pairs;
+         p += (long long)gridDim.x * blockDim.x) {
+        const int a = p / n2;
+        const int b = p % n2;
+        if (triangle && b <= a)
+            continue;
+        const long long i = idx1[a];
+        const long long j = idx2[b];
+        if (i == j)
+            continue;
+        double r2 = 0.0;
+        for (int k = 0; k < 3; k++) {
+            double d = positions[3 * j + k] - positions[3 * i + k];
+            if (box[k] > 0.0)
+                d -= box[k] * rint(d / box[k]);
+            r2 += d * d;
+        }
+        if (r2 < rmax2) {
+            const int bin = (int)(sqrt(r2) * inv_dr);
+            if (bin < n_bins)
+                atomicAdd(&block_hist[bin], 1u);
+        }
+    }
+    __syncthreads();
+
+    for (int b = threadIdx.x; b < n_bins; b += blockDim.x)
+        if (block_hist[b])
+            atomicAdd(&hist[b], (unsigned long long)block_hist[b]);
+}
+'''
+
+if cp is not None:
+    _rdf_cuda_kernel = cp.RawKernel(_RDF_CUDA_SOURCE, 'rdf_histogram')
+
+def _rdf_histogram_cuda(positions, idx1, idx2, triangle, box, rmax, n_bins):
+    """
+    Pair-distance histogram on the GPU; arguments as for _rdf_histogram_numba
+    """
+    threads = 256
+    n_pairs = len(idx1) * len(idx2)
+    blocks = max(1, min(-(-n_pairs // threads), 4096))
+    hist = cp.zeros(n_bins, dtype=cp.uint64)
+    _rdf_cuda_kernel(
+        (blocks,), (threads,),
+        (cp.asarray(positions, dtype=cp.float64), cp.asarray(idx1, dtype=cp.int64),
+         cp.asarray(idx2, dtype=cp.int64), np.int32(len(idx1)), np.int32(len(idx2)),
+         np.int32(triangle), cp.asarray(box, dtype=cp.float64), np.float64(rmax),
+         np.int32(n_bins), hist),
+        shared_mem=n_bins * 4)
+    return cp.asnumpy(hist).astype(np.int64)
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """Copy of a buffer with room for at least size items, at least doubled"""
+    grown = np.empty(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+class _BondAccumulator:
+    """
+    Collects per-frame bond results into the analyze_bonds output
+    
+    Results are written into preallocated arrays (grown by doubling when
+    the frame count isn't known or the bond count exceeds the estimate)
+    rather than lists of per-frame arrays that are concatenated at the end.
+    """
+    
+    def __init__(self, n_frames: Optional[int] = None):
+        self.n_frames = 0
+        self.counts = np.empty(n_frames or 64, dtype=np.int64)
+        self.length_sums = np.empty(n_frames or 64)
+        self.lengths = np.empty(0, dtype=np.float32)
+        self.n_lengths = 0
+        
+    def update(self, frame_bonds: int, frame_lengths: np.ndarray) -> None:
+        """Add one frame's bond count and bond lengths"""
+        if self.n_frames == len(self.counts):
+            self.counts = _grow(self.counts, self.n_frames + 1)
+            self.length_sums = _grow(self.length_sums, self.n_frames + 1)
+        end = self.n_lengths + len(frame_lengths)
+        if end > len(self.lengths):
+            if self.n_frames == 0:
+                # Size for every frame bonding like the first one
+                self.lengths = np.empty(len(frame_lengths) * len(self.counts), dtype=np.float32)
+            if end > len(self.lengths):
+                self.lengths = _grow(self.lengths, end)
+        
+        # Lengths are kept as float32 (~1e-6 A at bond scale), the mean
+        # is taken from the full-precision values
+        self.counts[self.n_frames] = frame_bonds
+        self.length_sums[self.n_frames] = frame_lengths.sum()
+        self.lengths[self.n_lengths:end] = frame_lengths
+        self.n_frames += 1
+        self.n_lengths = end
+        
+    def finalize(self) -> Dict:
+        """Bond results; 'lengths' holds every frame's bond lengths back to
+        back, split by 'frame_ptr'"""
+        # Bond lengths of all frames in one flat array (CSR layout): frame i
+        # owns lengths[frame_ptr[i]:frame_ptr[i + 1]]
+        counts = self.counts[:self.n_frames].copy()
+        frame_ptr = np.concatenate(([0], np.cumsum(counts)))
+        lengths = self.lengths[:self.n_lengths].copy()
+        
+        # Mean over frames of the per-frame mean length
+        length_sums = self.length_sums[:self.n_frames]
+        bonded = counts > 0
+        
+        return {
+            'counts': counts,
+            'lengths': lengths,
+            'frame_ptr': frame_ptr,
+            'avg_count': np.mean(counts),
+            'avg_length': np.mean(length_sums[bonded] / counts[bonded])
+        }
+
+class _RDFAccumulator:
+    """
+    Sums per-frame pair histograms into a normalized g(r)
+    """
+    
+    def __init__(self, r_bins: np.ndarray):
+        self.r_bins = r_bins
+        self.counts = np.zeros(len(r_bins) - 1, dtype=np.int64)  # Pair counts, exact
+        self.n_frames = 0
+        self.cell = None
+        
+    def update(self, hist: np.ndarray, cell: np.ndarray) -> None:
+        """Add one sampled frame's pair histogram"""
+        if hist.any():
+            self.counts += hist
+            self.n_frames += 1
+        self.cell = cell
+        
+    def finalize(self, n_atoms: int, pbc: np.ndarray,
+                 elements: Optional[Tuple[str, str]] = None) -> Dict:
+        """RDF results, normalized by the volume of the last sampled frame"""
+        r_bins = self.r_bins
+        dr = r_bins[1] - r_bins[0]
+        r_centers = (r_bins[:-1] + r_bins[1:]) / 2
+        shell_volumes = 4 * np.pi * r_centers**2 * dr
+        
+        if self.n_frames > 0:
+            volume = Atoms(cell=self.cell, pbc=pbc).get_volume()
+            rdf = self.counts / (self.n_frames * shell_volumes * (n_atoms / volume))
+        else:
+            rdf = np.zeros_like(r_centers)
+        rdf = rdf.astype(np.float32)  # Plenty for a ~3 significant figure curve
+        
+        return {
+            'r': r_centers,
+            'g_r': rdf,
+            'elements': elements,
+            'frames_analyzed': self.n_frames
+        }
+
+class _EnergyAccumulator:
+    """
+    Running potential-energy statistics for the analyze_energy output
+    
+    Mean and variance are updated in one pass with Welford's algorithm,
+    along with min and max, so the per-frame series is only stored when
+    keep_values is set.
+    """
+    
+    def __init__(self, n_frames: Optional[int] = None, keep_values: bool = True):
+        self.values = np.empty(n_frames or 64) if keep_values else None
+        self.n_values = 0
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        
+    def update(self, energy: float) -> None:
+        """Add one frame's energy (NaN if it has none)"""
+        if self.values is not None:
+            if self.n_values == len(self.values):
+                self.values = _grow(self.values, self.n_values + 1)
+            self.values[self.n_values] = energy
+            self.n_values += 1
+        if np.isnan(energy):
+            return
+        
+        self.n += 1
+        delta = energy - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (energy - self.mean)
+        self.min = min(self.min, energy)
+        self.max = max(self.max, energy)
+        
+    def extend(self, energies: np.ndarray) -> None:
+        """Add a block of frames' energies, merging the block's statistics
+        into the running ones (Chan et al.'s pairwise update)"""
+        if self.values is not None:
+            end = self.n_values + len(energies)
+            if end > len(self.values):
+                self.values = _grow(self.values, end)
+            self.values[self.n_values:end] = energies
+            self.n_values = end
+        valid = energies[~np.isnan(energies)]
+        if len(valid) == 0:
+            return
+        
+        n_block = len(valid)
+        mean_block = valid.mean()
+        delta = mean_block - self.mean
+        n = self.n + n_block
+        self.mean += delta * n_block / n
+        self.m2 += np.sum((valid - mean_block)**2) + delta**2 * self.n * n_block / n
+        self.n = n
+        self.min = min(self.min, valid.min())
+        self.max = max(self.max, valid.max())
+        
+    def finalize(self) -> Dict:
+        """Energy results, or {} if no frame has an energy; 'values' (NaN
+        where a frame has no energy) only if kept"""
+        if self.n == 0:
+            return {}
+        
+        results = {}
+        if self.values is not None:
+            results['values'] = self.values[:self.n_values].copy()
+        results.update({
+            'mean': float(self.mean),
+            'std': float(np.sqrt(self.m2 / self.n)),
+            'min': float(self.min),
+            'max': float(self.max)
+        })
+        return results
+
 class ProbaahTrajectoryAnalyzer:
     """
     Comprehensive trajectory analysis using ASE
     Perfect for ReaxFF and other MD simulations
     """
     
-    def __init__(self, trajectory_file: str, output_dir: Optional[str] = None):
+    def __init__(self, trajectory_file: str, output_dir: Optional[str] = None,
+                 stream: bool = False):
         """
         Initialize trajectory analyzer
         
         Args:
             trajectory_file: Path to trajectory (.xyz, .traj, etc.)
             output_dir: Directory for output files
+            stream: Read frames from the file on each analysis pass instead
+                of loading them (memory independent of trajectory length)
         """
         self.trajectory_file = Path(trajectory_file)
         self.output_dir = Path(output_dir) if output_dir else self.trajectory_file.parent / "analysis"
         self.output_dir.mkdir(exist_ok=True)
         
-        # Load trajectory
-        print(f"🔍 Loading trajectory: {self.trajectory_file}")
-        self.trajectory = read(str(self.trajectory_file), index=':')
-        self.n_frames = len(self.trajectory)
-        self.n_atoms = len(self.trajectory[0])
+        first = read(str(self.trajectory_file), index=0)
+        self.n_atoms = len(first)
+        self.numbers = first.numbers.copy()
+        self.pbc = first.pbc.copy()
         
-        print(f"✅ Loaded {self.n_frames} frames with {self.n_atoms} atoms each")
+        if stream:
+            # Frame count is filled in by the first full pass
+            print(f"🔍 Streaming trajectory: {self.trajectory_file}")
+            self.n_frames = None
+            self.positions = self.cells = self.energies = None
+        else:
+            # Load trajectory as contiguous arrays (structure of arrays). Frames
+            # are read one at a time, so the Atoms objects are never all alive.
+            print(f"🔍 Loading trajectory: {self.trajectory_file}")
+            positions, cells, energies = [], [], []
+            for atoms in self.frames():
+                positions.append(atoms.positions)
+                cells.append(atoms.cell.array)
+                energies.append(_frame_energy(atoms))
+            self.n_frames = len(positions)
+            self.positions = np.stack(positions)
+            self.cells = np.stack(cells)
+            self.energies = np.array(energies)
+            
+            print(f"✅ Loaded {self.n_frames} frames with {self.n_atoms} atoms each")
         
         # Analysis results storage
         self.results = {}
         
+    def frames(self) -> Iterator[Atoms]:
+        """
+        Iterate over the trajectory file one frame at a time
+        
+        Returns:
+            Generator of Atoms objects
+        """
+        return iread(str(self.trajectory_file), index=':')
+    
+    def _atoms(self, positions: np.ndarray, cell: np.ndarray) -> Atoms:
+        """Atoms object for one frame's positions and cell"""
+        return Atoms(numbers=self.numbers, positions=positions, cell=cell, pbc=self.pbc)
+    
+    def _frame_data(self, indices: Optional[np.ndarray] = None
+                    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Positions and cell of frames, from memory or the file
+        
+        Args:
+            indices: Increasing frame indices to visit (default: all
+                frames); indices past the last frame are skipped
+            
+        Yields:
+            (frame index, positions, cell)
+        """
+        if self.positions is not None:
+            for index in (range(self.n_frames) if indices is None else indices):
+                if index >= self.n_frames:
+                    return
+                yield index, self.positions[index], self.cells[index]
+        elif indices is None:
+            for index, atoms in enumerate(self.frames()):
+                yield index, atoms.positions, atoms.cell.array
+        else:
+            frames = self.frames()
+            previous = -1
+            for index in indices:
+                atoms = next(islice(frames, index - previous - 1, None), None)
+                if atoms is None:
+                    return  # End of the file
+                previous = index
+                yield index, atoms.positions, atoms.cell.array
+    
+    def _count_frames(self, full_pass: bool = True) -> Optional[int]:
+        """
+        Number of frames in the trajectory file
+        
+        The header-only energy reader counts .xyz/.extxyz/.traj frames
+        cheaply. Other formats need a full extra read of the file, which
+        is done only when full_pass is set.
+        
+        Returns:
+            Frame count, or None if it would take a full pass
+        """
+        energies = _read_energies(self.trajectory_file)
+        if energies is not None:
+            return len(energies)
+        if not full_pass:
+            return None
+        return sum(1 for _ in self.frames())
+    
+    def _progress(self, index: int) -> None:
+        """Print progress, with the frame count once it's known"""
+        total = f"/{self.n_frames}" if self.n_frames is not None else ""
+        print(f"  Processed frame {index}{total}")
+    
+    def _frame_records(self) -> Iterator[Tuple[int, np.ndarray, np.ndarray, float]]:
+        """
+        Positions, cell and energy of every frame, from memory or the file
+        
+        Yields:
+            (frame index, positions, cell, energy or NaN)
+        """
+        if self.positions is not None:
+            for index in range(self.n_frames):
+                yield index, self.positions[index], self.cells[index], self.energies[index]
+        else:
+            for index, atoms in enumerate(self.frames()):
+                yield index, atoms.positions, atoms.cell.array, _frame_energy(atoms)
+    
+    def analyze_all(self, bonds: bool = True, rdf: bool = True, energy: bool = True,
+                    cutoff_factor: float = 1.2, rmax: float = 10.0, nbins: int = 200,
+                    rdf_elements: Optional[Tuple[str, str]] = None,
+                    n_samples: Optional[int] = None,
+                    energy_values: bool = True,
+                    max_workers: Optional[int] = None) -> Dict:
+        """
+        Run bond, RDF and energy analysis in a single pass over the trajectory
+        
+        Each frame is read once and fed to every selected analysis, instead
+        of one pass (and, when streaming, one file read) per analysis. The
+        results are the same as those of the separate methods.
+        
+        Args:
+            bonds: Perform bond analysis
+            rdf: Calculate RDF
+            energy: Analyze energy
+            cutoff_factor: Multiplier for covalent radii to define bonds
+            rmax: Maximum distance for RDF
+            nbins: Number of RDF bins
+            rdf_elements: Pair of elements for the RDF (e.g., ('C', 'O'))
+            n_samples: Frames the RDF averages over (default: one in ten;
+                see calculate_rdf)
+            energy_values: Keep the per-frame energy series, not just its
+                statistics
+            max_workers: Threads for the per-frame work (default: CPU count)
+            
+        Returns:
+            Dictionary with all analysis results
+        """
+        print("🔬 Analyzing trajectory in a single pass...")
+        
+        frame_bonds_of = self._bond_frame_func(cutoff_factor) if bonds else None
+        bond_acc = _BondAccumulator(self.n_frames)
+        energy_acc = _EnergyAccumulator(self.n_frames, keep_values=energy_values)
+        r_bins = pairs = None
+        sampled = set()
+        if rdf:
+            r_bins, pairs, sample_idx = self._rdf_plan(rmax, nbins, rdf_elements, n_samples)
+            sampled = sample_idx if isinstance(sample_idx, range) else set(sample_idx.tolist())
+            rdf_acc = _RDFAccumulator(r_bins)
+        
+        def analyze_frame(record):
+            index, positions, cell, frame_energy = record
+            frame_bonds = frame_bonds_of((index, positions, cell)) if bonds else None
+            hist = (self._pair_histogram(positions, cell, r_bins, pairs)
+                    if index in sampled else None)
+            return index, cell, frame_bonds, hist, frame_energy
+        
+        records = self._frame_records()
+        if rdf:
+            results = self._map_histograms(analyze_frame, records, max_workers)
+        else:
+            results = _map_frames(analyze_frame, records, max_workers)
+        
+        n_frames = 0
+        for index, cell, frame_bonds, hist, frame_energy in results:
+            if frame_bonds is not None:
+                bond_acc.update(*frame_bonds)
+            if hist is not None:
+                rdf_acc.update(hist, cell)
+            if energy:
+                energy_acc.update(frame_energy)
+            n_frames += 1
+            
+            if index % 100 == 0:
+                self._progress(index)
+        self.n_frames = n_frames
+        
+        if bonds:
+            self.results['bonds'] = bond_acc.finalize()
+            print(f"✅ Bond analysis complete. Average bonds: {self.results['bonds']['avg_count']:.1f}")
+        
+        if rdf:
+            self.results['rdf'] = rdf_acc.finalize(self.n_atoms, self.pbc, rdf_elements)
+            print(f"✅ RDF calculation complete. Analyzed {rdf_acc.n_frames} frames.")
+        
+        if energy:
+            energy_results = energy_acc.finalize()
+            if energy_results:
+                self.results['energy'] = energy_results
+                print(f"✅ Energy analysis complete. Mean energy: {energy_results['mean']:.2f}")
+            else:
+                print("⚠️  No energy data found in trajectory")
+        
+        return self.results
+    
     def analyze_bonds(self, cutoff_factor: float = 1.2, 
-                     elements: Optional[List[str]] = None) -> Dict:
+                     elements: Optional[List[str]] = None,
+                     max_workers: Optional[int] = None) -> Dict:
         """
         Analyze bond formation/breaking throughout trajectory
         
         Args:
             cutoff_factor: Multiplier for covalent radii to define bonds
             elements: Specific elements to analyze (default: all)
+            max_workers: Threads for the per-frame work (default: CPU count)
             
         Returns:
-            Dictionary with bond analysis results
+            Dictionary with bond analysis results; 'lengths' holds every
+            frame's bond lengths back to back, split by 'frame_ptr'
         """
         print("🔗 Analyzing bonds...")
         
-        bond_counts = []
-        bond_lengths = []
-        
-        for frame_idx, atoms in enumerate(self.trajectory):
-            # Create neighbor list
-            cutoffs = []
-            for atom in atoms:
-                radius = covalent_radii[atom.number] * cutoff_factor
-                cutoffs.append(radius)
-            
-            nl = NeighborList(cutoffs, self_interaction=False, bothways=True)
-            nl.update(atoms)
-            
-            frame_bonds = 0
-            frame_lengths = []
-            
-            for i in range(len(atoms)):
-                indices, offsets = nl.get_neighbors(i)
-                for j in indices:
-                    if i < j:  # Count each bond only once
-                        distance = atoms.get_distance(i, j)
-                        frame_bonds += 1
-                        frame_lengths.append(distance)
-            
-            bond_counts.append(frame_bonds)
-            bond_lengths.append(frame_lengths)
+        # Frames are independent; a thread pool lets the compiled neighbour
+        # search and NumPy work overlap without copying frame data
+        frame_bonds_of = self._bond_frame_func(cutoff_factor)
+        bonds = _BondAccumulator(self.n_frames)
+        for frame_idx, (frame_bonds, frame_lengths) in enumerate(
+                _map_frames(frame_bonds_of, self._frame_data(), max_workers)):
+            bonds.update(frame_bonds, frame_lengths)
             
             if frame_idx % 100 == 0:
-                print(f"  Processed frame {frame_idx}/{self.n_frames}")
+                self._progress(frame_idx)
+        self.n_frames = bonds.n_frames
         
         # Store results
-        self.results['bonds'] = {
-            'counts': bond_counts,
-            'lengths': bond_lengths,
-            'avg_count': np.mean(bond_counts),
-            'avg_length': np.mean([np.mean(lengths) for lengths in bond_lengths if lengths])
-        }
+        self.results['bonds'] = bonds.finalize()
         
         print(f"✅ Bond analysis complete. Average bonds: {self.results['bonds']['avg_count']:.1f}")
         return self.results['bonds']
     
+    def _bond_frame_func(self, cutoff_factor: float):
+        """
+        Per-frame bond function for a cutoff factor
+        
+        Returns:
+            Function mapping (frame index, positions, cell) to
+            (bond count, bond lengths)
+        """
+        # Neighbour-list cutoff per element pair for matscipy's cell-list
+        # search: the bond cutoff plus the Verlet skin, so a list stays valid
+        # over several frames
+        radii = covalent_radii * cutoff_factor + NEIGHBOR_SKIN
+        species = np.unique(self.numbers)
+        pair_cutoffs = {(int(z1), int(z2)): radii[z1] + radii[z2] + VERLET_SKIN
+                        for z1, z2 in combinations_with_replacement(species, 2)}
+        numbers = self.numbers.astype(np.int32)  # dtype matscipy expects
+        
+        # Per-atom bond cutoffs (before the skin) for the ase neighbor_list
+        # fallback and the reused-list check; species don't change between
+        # frames, so this is built once
+        cutoffs = covalent_radii[self.numbers] * cutoff_factor
+        
+        # Neighbour list reused between frames. Each worker thread keeps its
+        # own, checked against the frames that thread itself processes.
+        neighbors = threading.local()
+        
+        return partial(self._frame_bonds, cutoffs=cutoffs, pair_cutoffs=pair_cutoffs,
+                       numbers=numbers, neighbors=neighbors)
+    
+    def _frame_bonds(self, frame: Tuple[int, np.ndarray, np.ndarray], cutoffs: np.ndarray, 
+                     pair_cutoffs: Dict[Tuple[int, int], float], 
+                     numbers: np.ndarray, 
+                     neighbors: Optional[threading.local] = None) -> Tuple[int, np.ndarray]:
+        """
+        Bonds of a single frame
+        
+        Args:
+            frame: (frame index, positions, cell)
+            cutoffs: Bond cutoff per atom
+            pair_cutoffs: Neighbour-list cutoff per element pair (matscipy path)
+            numbers: Atomic numbers as int32 (matscipy path)
+            neighbors: Neighbour list kept from earlier frames (matscipy path)
+            
+        Returns:
+            (bond count, bond lengths)
+        """
+        _, positions, cell = frame
+        has_cell = np.linalg.det(cell) != 0
+        if neighbour_list is not None and (has_cell or not self.pbc.any()):
+            if neighbors is None:
+                neighbors = threading.local()
+            
+            # The list holds every pair within bond cutoff + VERLET_SKIN, so
+            # it is complete until some atom has moved VERLET_SKIN / 2 from
+            # where it was built (or the cell changes)
+            reference = getattr(neighbors, 'positions', None)
+            if (reference is None or not np.array_equal(cell, neighbors.cell) or
+                    np.einsum('ij,ij->i', positions - reference, positions - reference).max()
+                    > (VERLET_SKIN / 2)**2):
+                if has_cell:
+                    search_positions, search_cell = positions, cell
+                else:
+                    # Non-periodic frame without a cell: search in its
+                    # bounding box, which gives the same pairs
+                    search_positions = positions - positions.min(axis=0)
+                    search_cell = np.diag(search_positions.max(axis=0) + 1.0)
+                i_idx, j_idx, shifts = neighbour_list(
+                    'ijS', positions=search_positions, cell=search_cell,
+                    pbc=self.pbc, numbers=numbers, cutoff=pair_cutoffs)
+                mask = i_idx < j_idx  # Count each bond only once
+                neighbors.positions = positions.copy()
+                neighbors.cell = cell.copy()
+                neighbors.i = i_idx[mask]
+                neighbors.j = j_idx[mask]
+                neighbors.offsets = shifts[mask] @ cell
+                neighbors.cutoffs = cutoffs[neighbors.i] + cutoffs[neighbors.j] + 2 * NEIGHBOR_SKIN
+            
+            # Only the distances of the listed pairs are recomputed
+            vectors = positions[neighbors.j] - positions[neighbors.i] + neighbors.offsets
+            distances = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+            frame_lengths = distances[distances < neighbors.cutoffs]
+            frame_bonds = len(frame_lengths)
+        else:
+            # No matscipy, or a periodic frame without a full cell. ase's
+            # neighbor_list returns all pairs and distances as flat arrays.
+            i_idx, j_idx, distances = ase_neighbor_list(
+                'ijd', self._atoms(positions, cell), cutoffs + NEIGHBOR_SKIN)
+            mask = i_idx < j_idx  # Count each bond only once
+            frame_lengths = distances[mask]
+            frame_bonds = len(frame_lengths)
+        return frame_bonds, frame_lengths
+    
     def calculate_rdf(self, rmax: float = 10.0, nbins: int = 200, 
-                     elements: Optional[Tuple[str, str]] = None) -> Dict:
+                     elements: Optional[Tuple[str, str]] = None,
+                     n_samples: Optional[int] = None,
+                     max_workers: Optional[int] = None) -> Dict:
         """
         Calculate radial distribution function
         
@@ -112,66 +824,165 @@ class ProbaahTrajectoryAnalyzer:
             rmax: Maximum distance for RDF
             nbins: Number of bins
             elements: Pair of elements to analyze (e.g., ('C', 'O'))
+            n_samples: Frames to average over, spread evenly from the first
+                to the last frame (default: one in ten frames). When
+                streaming a format without a cheap frame count, the default
+                takes every tenth frame from the start instead, and an
+                explicit n_samples costs one extra read to count frames.
+            max_workers: Threads for the per-frame work with the NumPy
+                backend (default: CPU count)
             
         Returns:
             Dictionary with RDF data
         """
         print("📊 Calculating radial distribution function...")
         
-        r_bins = np.linspace(0, rmax, nbins)
-        dr = r_bins[1] - r_bins[0]
+        r_bins, pairs, sample_idx = self._rdf_plan(rmax, nbins, elements, n_samples)
         
-        rdf_sum = np.zeros(nbins - 1)
-        n_frames_used = 0
+        def frame_histogram(frame):
+            index, positions, cell = frame
+            return index, cell, self._pair_histogram(positions, cell, r_bins, pairs)
         
-        for frame_idx, atoms in enumerate(self.trajectory[::10]):  # Sample every 10th frame
-            distances = []
-            
-            if elements:
-                # Filter for specific element pairs
-                elem1_indices = [i for i, atom in enumerate(atoms) if atom.symbol == elements[0]]
-                elem2_indices = [i for i, atom in enumerate(atoms) if atom.symbol == elements[1]]
-                
-                for i in elem1_indices:
-                    for j in elem2_indices:
-                        if i != j:
-                            dist = atoms.get_distance(i, j)
-                            if dist < rmax:
-                                distances.append(dist)
-            else:
-                # All pairs
-                for i in range(len(atoms)):
-                    for j in range(i + 1, len(atoms)):
-                        dist = atoms.get_distance(i, j)
-                        if dist < rmax:
-                            distances.append(dist)
-            
-            if distances:
-                hist, _ = np.histogram(distances, bins=r_bins)
-                rdf_sum += hist
-                n_frames_used += 1
+        rdf = _RDFAccumulator(r_bins)
+        histograms = self._map_histograms(frame_histogram, self._frame_data(sample_idx),
+                                          max_workers)
+        for sample, (index, cell, hist) in enumerate(histograms):
+            rdf.update(hist, cell)
             
-            if frame_idx % 50 == 0:
-                print(f"  Processed frame {frame_idx * 10}/{self.n_frames}")
+            if sample % 50 == 0:
+                self._progress(index)
         
-        # Normalize RDF
-        r_centers = (r_bins[:-1] + r_bins[1:]) / 2
-        shell_volumes = 4 * np.pi * r_centers**2 * dr
+        self.results['rdf'] = rdf.finalize(self.n_atoms, self.pbc, elements)
+        
+        print(f"✅ RDF calculation complete. Analyzed {rdf.n_frames} frames.")
+        return self.results['rdf']
+    
+    def _rdf_plan(self, rmax: float, nbins: int, 
+                  elements: Optional[Tuple[str, str]] = None,
+                  n_samples: Optional[int] = None
+                  ) -> Tuple[np.ndarray, Optional[Tuple[np.ndarray, np.ndarray]],
+                             Union[np.ndarray, range]]:
+        """
+        Bins, atom index sets and sampled frames of an RDF calculation
         
-        if n_frames_used > 0:
-            rdf = rdf_sum / (n_frames_used * shell_volumes * (self.n_atoms / atoms.get_volume()))
+        Returns:
+            (bin edges, atom index pair or None, sampled frame indices);
+            the indices are an open-ended stride range when the frame
+            count isn't known
+        """
+        r_bins = np.linspace(0, rmax, nbins)
+        
+        if elements:
+            symbols = np.array(chemical_symbols)[self.numbers]
+            pairs = (np.where(symbols == elements[0])[0],
+                     np.where(symbols == elements[1])[0])
         else:
-            rdf = np.zeros_like(r_centers)
+            pairs = None
         
-        self.results['rdf'] = {
-            'r': r_centers,
-            'g_r': rdf,
-            'elements': elements,
-            'frames_analyzed': n_frames_used
-        }
+        if self.n_frames is None:
+            # A stream not read through yet. Without a cheap count, the
+            # default one-in-ten is taken by stride instead of reading the
+            # whole file an extra time.
+            self.n_frames = self._count_frames(full_pass=n_samples is not None)
+            if self.n_frames is None:
+                return r_bins, pairs, range(0, sys.maxsize, 10)
+        if n_samples is None:
+            n_samples = -(-self.n_frames // 10)
+        sample_idx = np.linspace(0, self.n_frames - 1, min(self.n_frames, n_samples), dtype=int)
+        return r_bins, pairs, sample_idx
+    
+    def _map_histograms(self, func, frames: Iterable, 
+                        max_workers: Optional[int] = None) -> Iterator:
+        """
+        Map a per-frame function that computes pair histograms over frames
         
-        print(f"✅ RDF calculation complete. Analyzed {n_frames_used} frames.")
-        return self.results['rdf']
+        The Cython and Numba kernels already spread each frame across all
+        cores (and Numba's threading layer must be driven from the main
+        thread), and the CUDA kernel fills the GPU, so only the NumPy
+        backend uses threads.
+        """
+        if _rdf_backend() != 'numpy':
+            return map(func, frames)
+        return _map_frames(func, frames, max_workers)
+    
+    def _pair_histogram(self, positions: np.ndarray, cell: np.ndarray, 
+                        r_bins: np.ndarray, 
+                        pairs: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+        """
+        Histogram of one frame's pair distances over r_bins
+        
+        Uses the CUDA, Cython or Numba kernel for non-periodic and orthorhombic cells
+        when that backend is selected, otherwise NumPy/SciPy distances.
+        
+        Args:
+            positions: Atom positions of the frame
+            cell: Cell matrix of the frame
+            r_bins: Uniform bin edges starting at 0
+            pairs: Two atom index sets to restrict to (default: all pairs)
+            
+        Returns:
+            Pair counts per bin
+        """
+        rmax = r_bins[-1]
+        box = _orthorhombic_box(cell, self.pbc)
+        backend = _rdf_backend()
+        if backend != 'numpy' and box is not None:
+            if pairs is not None:
+                idx1, idx2 = pairs
+                triangle = False
+            else:
+                idx1 = idx2 = np.arange(len(positions))
+                triangle = True
+            if backend == 'cuda':
+                return _rdf_histogram_cuda(positions, idx1, idx2, triangle,
+                                           box, rmax, len(r_bins) - 1)
+            if backend == 'cython':
+                return _rdf_histogram_cython(np.ascontiguousarray(positions, dtype=np.float64),
+                                             idx1, idx2, triangle, box, rmax, len(r_bins) - 1)
+            return _rdf_histogram_numba(positions, idx1, idx2, triangle,
+                                        box, rmax, len(r_bins) - 1,
+                                        numba.get_num_threads())
+        
+        # Pairs beyond rmax are dropped on squared distances, without a sqrt.
+        # Bins are uniform, so the rest are binned by direct index, the same
+        # way as the Numba kernel, instead of a search over the bin edges.
+        sq_distances = self._pair_sq_distances(positions, cell, pairs)
+        n_bins = len(r_bins) - 1
+        in_range = sq_distances[sq_distances < rmax**2]
+        bin_idx = (np.sqrt(in_range) * (n_bins / rmax)).astype(np.int64)
+        return np.bincount(bin_idx[bin_idx < n_bins], minlength=n_bins)
+    
+    def _pair_sq_distances(self, positions: np.ndarray, cell: np.ndarray, 
+                           pairs: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+        """
+        All squared pair distances of one frame as a flat array
+        
+        Args:
+            positions: Atom positions of the frame
+            cell: Cell matrix of the frame
+            pairs: Two atom index sets to restrict to (default: all pairs)
+            
+        Returns:
+            Squared distances of unique pairs (i < j), or of every (i, j)
+            with i != j between the two index sets
+        """
+        periodic = self.pbc.any()
+        if pairs is not None:
+            idx1, idx2 = pairs
+            if periodic:
+                vectors, _ = get_distances(positions[idx1], positions[idx2],
+                                           cell=cell, pbc=self.pbc)
+                sq_dist = np.einsum('ijk,ijk->ij', vectors, vectors)
+            else:
+                sq_dist = cdist(positions[idx1], positions[idx2], 'sqeuclidean')
+            return sq_dist[idx1[:, None] != idx2[None, :]]
+        
+        if periodic:
+            # Minimum-image distances across periodic boundaries
+            vectors, _ = get_distances(positions, cell=cell, pbc=self.pbc)
+            upper = np.triu_indices(len(positions), k=1)
+            return np.einsum('ij,ij->i', vectors[upper], vectors[upper])
+        return pdist(positions, 'sqeuclidean')
     
     def analyze_energy(self) -> Dict:
         """
@@ -179,138 +990,136 @@ class ProbaahTrajectoryAnalyzer:
         """
         print("⚡ Analyzing energy evolution...")
         
-        energies = []
-        for atoms in self.trajectory:
-            try:
-                energy = atoms.get_potential_energy()
-                energies.append(energy)
-            except:
-                # Energy not available in this frame
-                energies.append(None)
+        if self.energies is None:
+            # Streaming: read energies straight from the file when the format
+            # allows, instead of parsing every frame
+            frame_energies = _read_energies(self.trajectory_file)
+            if frame_energies is None:
+                frame_energies = np.array([_frame_energy(atoms) for atoms in self.frames()])
+            self.n_frames = len(frame_energies)
+        else:
+            frame_energies = self.energies
         
-        if all(e is None for e in energies):
+        energy = _EnergyAccumulator(len(frame_energies))
+        energy.extend(frame_energies)
+        energy = energy.finalize()
+        if not energy:
             print("⚠️  No energy data found in trajectory")
             return {}
         
-        # Filter out None values
-        valid_energies = [e for e in energies if e is not None]
-        
-        self.results['energy'] = {
-            'values': energies,
-            'mean': np.mean(valid_energies),
-            'std': np.std(valid_energies),
-            'min': np.min(valid_energies),
-            'max': np.max(valid_energies)
-        }
+        self.results['energy'] = energy
         
         print(f"✅ Energy analysis complete. Mean energy: {self.results['energy']['mean']:.2f}")
         return self.results['energy']
     
-    def create_plots(self, style: str = 'publication') -> Dict[str, str]:
+    def create_plots(self, style: str = 'publication', dpi: Optional[int] = None) -> Dict[str, str]:
         """
         Generate publication-quality plots
         
         Args:
             style: Plot style ('publication', 'presentation', 'quick')
+            dpi: Output resolution (defaults to 300 for publication, 150 otherwise)
             
         Returns:
             Dictionary mapping plot types to file paths
         """
         print("📈 Creating plots...")
         
-        # Set style
+        if dpi is None:
+            dpi = 300 if style == 'publication' else 150
+        
+        # Scope the style to this call instead of mutating global rcParams
         if style == 'publication':
-            plt.style.use('seaborn-v0_8-whitegrid')
-            plt.rcParams.update({
+            plot_style = ['seaborn-v0_8-whitegrid', {
                 'font.size': 12,
                 'axes.linewidth': 1.5,
-                'lines.linewidth': 2,
-                'figure.dpi': 300
-            })
+                'lines.linewidth': 2
+            }]
+        else:
+            plot_style = {}
         
         plot_files = {}
         
-        # Bond count evolution
-        if 'bonds' in self.results:
+        with plt.style.context(plot_style):
+            # One figure is reused for every plot and cleared in between
             fig, ax = plt.subplots(figsize=(10, 6))
-            frames = range(len(self.results['bonds']['counts']))
-            ax.plot(frames, self.results['bonds']['counts'], 'b-', alpha=0.7)
-            ax.set_xlabel('Frame')
-            ax.set_ylabel('Number of Bonds')
-            ax.set_title('Bond Count Evolution')
-            ax.grid(True, alpha=0.3)
             
-            plot_file = self.output_dir / 'bond_evolution.png'
-            plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-            plt.close()
-            plot_files['bond_evolution'] = str(plot_file)
-            print(f"  📊 Saved: {plot_file}")
-        
-        # RDF plot
-        if 'rdf' in self.results:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            rdf_data = self.results['rdf']
-            ax.plot(rdf_data['r'], rdf_data['g_r'], 'r-', linewidth=2)
-            ax.set_xlabel('Distance (Å)')
-            ax.set_ylabel('g(r)')
-            title = 'Radial Distribution Function'
-            if rdf_data['elements']:
-                title += f" ({rdf_data['elements'][0]}-{rdf_data['elements'][1]})"
-            ax.set_title(title)
-            ax.grid(True, alpha=0.3)
-            ax.set_ylim(bottom=0)
+            def save(name: str) -> None:
+                plot_file = self.output_dir / f'{name}.png'
+                fig.savefig(plot_file, dpi=dpi, bbox_inches='tight')
+                ax.clear()
+                plot_files[name] = str(plot_file)
+                print(f"  📊 Saved: {plot_file}")
             
-            plot_file = self.output_dir / 'rdf.png'
-            plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-            plt.close()
-            plot_files['rdf'] = str(plot_file)
-            print(f"  📊 Saved: {plot_file}")
-        
-        # Energy evolution
-        if 'energy' in self.results and self.results['energy']:
-            energies = self.results['energy']['values']
-            valid_energies = [e for e in energies if e is not None]
-            if valid_energies:
-                fig, ax = plt.subplots(figsize=(10, 6))
-                frames = [i for i, e in enumerate(energies) if e is not None]
-                ax.plot(frames, valid_energies, 'g-', alpha=0.8)
-                ax.set_xlabel('Frame')
-                ax.set_ylabel('Energy (eV)')
-                ax.set_title('Energy Evolution')
-                ax.grid(True, alpha=0.3)
+            try:
+                # Bond count evolution
+                if 'bonds' in self.results:
+                    frames = range(len(self.results['bonds']['counts']))
+                    ax.plot(frames, self.results['bonds']['counts'], 'b-', alpha=0.7)
+                    ax.set_xlabel('Frame')
+                    ax.set_ylabel('Number of Bonds')
+                    ax.set_title('Bond Count Evolution')
+                    ax.grid(True, alpha=0.3)
+                    save('bond_evolution')
                 
-                plot_file = self.output_dir / 'energy_evolution.png'
-                plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-                plt.close()
-                plot_files['energy_evolution'] = str(plot_file)
-                print(f"  📊 Saved: {plot_file}")
+                # RDF plot
+                if 'rdf' in self.results:
+                    rdf_data = self.results['rdf']
+                    ax.plot(rdf_data['r'], rdf_data['g_r'], 'r-', linewidth=2)
+                    ax.set_xlabel('Distance (Å)')
+                    ax.set_ylabel('g(r)')
+                    title = 'Radial Distribution Function'
+                    if rdf_data['elements']:
+                        title += f" ({rdf_data['elements'][0]}-{rdf_data['elements'][1]})"
+                    ax.set_title(title)
+                    ax.grid(True, alpha=0.3)
+                    ax.set_ylim(bottom=0)
+                    save('rdf')
+                
+                # Energy evolution
+                if 'energy' in self.results and 'values' in self.results['energy']:
+                    energies = self.results['energy']['values']
+                    frames = np.flatnonzero(~np.isnan(energies))
+                    if len(frames):
+                        ax.plot(frames, energies[frames], 'g-', alpha=0.8)
+                        ax.set_xlabel('Frame')
+                        ax.set_ylabel('Energy (eV)')
+                        ax.set_title('Energy Evolution')
+                        ax.grid(True, alpha=0.3)
+                        save('energy_evolution')
+            finally:
+                plt.close(fig)
         
         print(f"✅ Created {len(plot_files)} plots in {self.output_dir}")
         return plot_files
     
     def save_results(self, filename: str = 'analysis_results.json') -> str:
         """
-        Save analysis results to JSON file
+        Save analysis results to JSON and NumPy archive files
+        
+        Scalars and metadata go to the JSON file. Array results (bond lengths,
+        RDF bins, energy series, ...) go to an .npz archive next to it with the
+        same stem, keyed as 'section/name' (e.g. 'rdf/g_r'), and can be read
+        back with np.load.
         
         Args:
             filename: Output filename
             
         Returns:
-            Path to saved file
+            Path to saved JSON file
         """
         output_file = self.output_dir / filename
+        arrays_file = output_file.with_suffix('.npz')
         
-        # Convert numpy arrays to lists for JSON serialization
+        # Split arrays out of the JSON results
         json_results = {}
+        arrays = {}
         for key, value in self.results.items():
             if isinstance(value, dict):
                 json_results[key] = {}
                 for k, v in value.items():
                     if isinstance(v, np.ndarray):
-                        json_results[key][k] = v.tolist()
-                    elif isinstance(v, list) and len(v) > 0 and isinstance(v[0], list):
-                        # Handle nested lists (like bond_lengths)
-                        json_results[key][k] = [sublist for sublist in v]
+                        arrays[f'{key}/{k}'] = v
                     else:
                         json_results[key][k] = v
             else:
@@ -319,7 +1128,12 @@ class ProbaahTrajectoryAnalyzer:
         with open(output_file, 'w') as f:
             json.dump(json_results, f, indent=2)
         
+        if arrays:
+            np.savez_compressed(arrays_file, **arrays)
+        
         print(f"💾 Saved results to: {output_file}")
+        if arrays:
+            print(f"💾 Saved arrays to: {arrays_file}")
         return str(output_file)
     
     def create_summary_report(self) -> str:
@@ -371,7 +1185,8 @@ class ProbaahTrajectoryAnalyzer:
 
 def analyze_trajectory_cli(trajectory_file: str, output_dir: str = None, 
                           bonds: bool = True, rdf: bool = True, 
-                          energy: bool = True, plots: bool = True) -> Dict:
+                          energy: bool = True, plots: bool = True,
+                          stream: bool = False) -> Dict:
     """
     Command-line interface for trajectory analysis
     
@@ -382,19 +1197,19 @@ def analyze_trajectory_cli(trajectory_file: str, output_dir: str = None,
         rdf: Calculate RDF
         energy: Analyze energy
         plots: Create plots
+        stream: Stream frames from the file instead of loading them
         
     Returns:
         Analysis results dictionary
     """
-    analyzer = ProbaahTrajectoryAnalyzer(trajectory_file, output_dir)
-    
-    if bonds:
-        analyzer.analyze_bonds()
-    
-    if rdf:
-        analyzer.calculate_rdf()
+    analyzer = ProbaahTrajectoryAnalyzer(trajectory_file, output_dir, stream=stream)
     
-    if energy:
+    # One pass over the frames for all analyses, keeping the energy series
+    # only for its plot; energies alone are read without building frames
+    # when streaming
+    if bonds or rdf:
+        analyzer.analyze_all(bonds=bonds, rdf=rdf, energy=energy, energy_values=plots)
+    elif energy:
         analyzer.analyze_energy()
     
     if plots:
@@ -0,0 +1,810 @@
+# FILE: plugins/presentation/pptx_generator/research_slides.py
+"""
+Automated PowerPoint Generation for Research Presentations
+Creates professional slides from analysis results
+"""
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN
+from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import copy
+import io
+import json
+import multiprocessing
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # Private python-pptx API; save_presentation falls back to
+    # Presentation.save on versions where it differs
+    from pptx.opc.serialized import PackageWriter
+except ImportError:
+    PackageWriter = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Results files above this size are streamed for the few summary values the
+# slides use instead of being parsed whole
+STREAMING_RESULTS_BYTES = 8 * 1024 * 1024
+
+# Scalar values add_analysis_results_slide reads from analysis_results.json
+_SUMMARY_FIELDS = {
+    'bonds.avg_count', 'bonds.avg_length',
+    'energy.mean', 'energy.std',
+    'rdf.frames_analyzed',
+}
+
+# Line breaks and other control characters that can't go into <a:t> as-is
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0a-\x1f]')
+
+# Resolution plots are resampled to before embedding. Analysis plots are
+# saved at 300 dpi, which is far more than a projected slide can show.
+EMBED_DPI = 150
+
+@lru_cache(maxsize=1)
+def _oxipng():
+    """oxipng module, imported on first use, or None if not installed"""
+    try:
+        import oxipng
+    except ImportError:
+        return None
+    return oxipng
+
+@lru_cache(maxsize=32)
+def _load_slide_image(path: str, mtime_ns: int, size: int,
+                      max_px: Tuple[int, int]) -> bytes:
+    """
+    Read an image, downsampled to fit within max_px if it is larger
+    
+    Args:
+        path: Image file path
+        mtime_ns: File modification time (part of the cache key only)
+        size: File size in bytes (part of the cache key only)
+        max_px: (width, height) bounding box in pixels
+        
+    Returns:
+        Encoded image bytes ready for add_picture
+    """
+    # Imported here so that loading this module doesn't pay for them
+    from PIL import Image
+    
+    with Image.open(path) as img:
+        image_format = img.format
+        if img.width <= max_px[0] and img.height <= max_px[1]:
+            data = Path(path).read_bytes()
+        else:
+            img.thumbnail(max_px, Image.LANCZOS)
+            
+            buffer = io.BytesIO()
+            if image_format == 'JPEG':
+                img.save(buffer, format='JPEG', quality=85, optimize=True)
+            else:
+                image_format = 'PNG'
+                img.save(buffer, format='PNG', optimize=True)
+            data = buffer.getvalue()
+    
+    oxipng = _oxipng()
+    if image_format == 'PNG' and oxipng is not None:
+        # Lossless recompression; also drops ancillary metadata chunks
+        data = oxipng.optimize_from_memory(data, level=2, strip=oxipng.StripChunks.safe())
+    return data
+
+@lru_cache(maxsize=32)
+def _load_json(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a JSON file, cached per path and modification time
+    
+    The returned dict is shared between callers and must not be modified.
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.dump writes NaN/Infinity, which strict parsers reject
+            pass
+    return json.loads(data)
+
+@lru_cache(maxsize=32)
+def _load_results_summary(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Load the summary values of an analysis_results.json file
+    
+    Large files are streamed with ijson and only the scalars in
+    _SUMMARY_FIELDS are kept, so per-frame arrays (bond lengths, RDF bins)
+    are never materialized. Small files, or any file ijson can't handle,
+    are parsed whole.
+    
+    Returns:
+        Results dict with the same nesting as the file
+    """
+    if ijson is None or size < STREAMING_RESULTS_BYTES:
+        return _load_json(path, mtime_ns)
+    
+    summary = {}
+    remaining = set(_SUMMARY_FIELDS)
+    try:
+        with open(path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if event == 'map_key' and prefix == '':
+                    summary.setdefault(value, {})
+                elif prefix in remaining and event not in ('start_map', 'start_array'):
+                    section, key = prefix.split('.')
+                    summary[section][key] = value
+                    remaining.discard(prefix)
+                    if not remaining:
+                        break
+    except ijson.JSONError:
+        # e.g. NaN written by json.dump
+        return _load_json(path, mtime_ns)
+    return summary
+
+@lru_cache(maxsize=32)
+def _load_yaml(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a YAML file, cached per path and modification time
+    
+    The returned dict is shared between callers and must not be modified.
+    """
+    import yaml
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+# Package members written without zip compression. PNG and JPEG data is
+# already compressed, so deflating it again costs CPU and saves ~nothing.
+_STORED_MEMBER_SUFFIXES = ('.png', '.jpg', '.jpeg')
+
+class _PptxZipWriter:
+    """
+    Zip writer for PackageWriter that stores image media uncompressed
+    
+    Drop-in for python-pptx's _ZipPkgWriter: XML parts are deflated at the
+    requested level, media in _STORED_MEMBER_SUFFIXES is stored as-is.
+    """
+    
+    def __init__(self, pkg_file, compression_level: Optional[int] = None):
+        self._zipf = zipfile.ZipFile(pkg_file, 'w', zipfile.ZIP_DEFLATED,
+                                     compresslevel=compression_level,
+                                     strict_timestamps=False)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self._zipf.close()
+    
+    def write(self, pack_uri, blob: bytes) -> None:
+        membername = pack_uri.membername
+        if membername.lower().endswith(_STORED_MEMBER_SUFFIXES):
+            self._zipf.writestr(membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(membername, blob)
+
+# Private PackageWriter methods _PptxPackageWriter relies on
+_PACKAGE_WRITER_METHODS = ('_write_content_types_stream', '_write_pkg_rels', '_write_parts')
+
+if PackageWriter is not None:
+    class _PptxPackageWriter(PackageWriter):
+        """python-pptx PackageWriter that writes through _PptxZipWriter"""
+        
+        def __init__(self, pkg_file, pkg_rels, parts,
+                     compression_level: Optional[int] = None):
+            super().__init__(pkg_file, pkg_rels, parts)
+            self._compression_level = compression_level
+        
+        def write_package(self) -> None:
+            """Write the package to pkg_file"""
+            with _PptxZipWriter(self._pkg_file, self._compression_level) as phys_writer:
+                self._write_content_types_stream(phys_writer)
+                self._write_pkg_rels(phys_writer)
+                self._write_parts(phys_writer)
+else:
+    _PptxPackageWriter = None
+
+def _write_stored_media(package, pkg_file: str,
+                        compression_level: Optional[int] = None) -> bool:
+    """
+    Write a python-pptx package with PNG/JPEG media stored uncompressed
+    
+    Returns:
+        False, without writing anything, if this python-pptx version
+        lacks the private PackageWriter API the writer builds on
+    """
+    if (_PptxPackageWriter is None or not hasattr(package, '_rels') or
+            not all(hasattr(PackageWriter, name) for name in _PACKAGE_WRITER_METHODS)):
+        return False
+    try:
+        writer = _PptxPackageWriter(pkg_file, package._rels, tuple(package.iter_parts()),
+                                    compression_level)
+    except TypeError:
+        # PackageWriter constructor with another signature
+        return False
+    if not hasattr(writer, '_pkg_file'):
+        return False
+    writer.write_package()
+    return True
+
+def _plot_box(layout: str) -> Tuple[int, int, int, int]:
+    """
+    Placement of a plot image on a slide
+    
+    Args:
+        layout: Slide layout type ('picture' or content)
+        
+    Returns:
+        (left, top, width, height) in EMU
+    """
+    if layout == "picture":
+        # Full slide image
+        return Inches(0.5), Inches(1.0), Inches(9), Inches(6.5)
+    # Content area image
+    return Inches(1.5), Inches(2.5), Inches(7), Inches(4.5)
+
+class ProbaahPresentationGenerator:
+    """
+    Automated research presentation generator
+    Perfect for weekly updates, conferences, and group meetings
+    """
+    
+    # Default styles, constructed once per process
+    TITLE_FONT_SIZE = Pt(32)
+    SUBTITLE_FONT_SIZE = Pt(20)
+    CONTENT_FONT_SIZE = Pt(18)
+    CAPTION_FONT_SIZE = Pt(14)
+    
+    # Penn State colors (or customize for your group)
+    PRIMARY_COLOR = RGBColor(30, 68, 128)  # Penn State Blue
+    ACCENT_COLOR = RGBColor(180, 30, 50)   # Research Red
+    TEXT_COLOR = RGBColor(50, 50, 50)      # Dark Gray
+    
+    def __init__(self, template_path: Optional[str] = None):
+        """
+        Initialize presentation generator
+        
+        Args:
+            template_path: Path to PowerPoint template (optional)
+        """
+        if template_path and Path(template_path).exists():
+            self.prs = Presentation(template_path)
+        else:
+            self.prs = Presentation()
+        
+        # Set up default styles
+        self.setup_default_styles()
+        
+    def setup_default_styles(self):
+        """Setup consistent styling for slides"""
+        self.title_font_size = self.TITLE_FONT_SIZE
+        self.subtitle_font_size = self.SUBTITLE_FONT_SIZE
+        self.content_font_size = self.CONTENT_FONT_SIZE
+        self.caption_font_size = self.CAPTION_FONT_SIZE
+        
+        self.primary_color = self.PRIMARY_COLOR
+        self.accent_color = self.ACCENT_COLOR
+        self.text_color = self.TEXT_COLOR
+        
+        # Styled title paragraph properties, built on first use
+        self._title_pPr = {}
+        # Opening <a:p><a:pPr> markup of content paragraphs per font color,
+        # built on first use
+        self._paragraph_open = {}
+    
+    def _set_title(self, title_shape, text: str, bold: bool = False) -> None:
+        """
+        Set a slide title in the deck's title style
+        
+        The styled paragraph properties are built once per generator and
+        deep-copied onto each title, instead of going through python-pptx's
+        font setters (several lxml lookups each) on every slide.
+        
+        Args:
+            title_shape: Title placeholder shape
+            text: Title text
+            bold: Bold title (title slide)
+        """
+        title_shape.text = text
+        paragraph = title_shape.text_frame.paragraphs[0]
+        if paragraph._p.pPr is not None:
+            # Template placeholder with its own paragraph properties
+            paragraph.font.size = self.title_font_size
+            paragraph.font.color.rgb = self.primary_color
+            if bold:
+                paragraph.font.bold = True
+            return
+        
+        if bold not in self._title_pPr:
+            bold_attr = ' b="1"' if bold else ''
+            self._title_pPr[bold] = parse_xml(
+                f'<a:pPr {nsdecls("a")}>'
+                f'<a:defRPr sz="{round(self.title_font_size.pt * 100)}"{bold_attr}>'
+                f'<a:solidFill><a:srgbClr val="{self.primary_color}"/></a:solidFill>'
+                f'</a:defRPr></a:pPr>'
+            )
+        paragraph._p.insert(0, copy.deepcopy(self._title_pPr[bold]))
+    
+    def _set_paragraphs(self, text_frame, lines: List[str],
+                        color: Optional[RGBColor] = None) -> None:
+        """
+        Replace the paragraphs of a text frame with content-styled lines
+        
+        All paragraphs are written as one XML fragment and parsed in a single
+        pass, rather than an add_paragraph() call plus font setters per line.
+        The styled paragraph prefix is rendered once per color and reused.
+        
+        Args:
+            text_frame: Text frame to fill
+            lines: One paragraph per line
+            color: Font color (default: inherited from the layout)
+        """
+        text_frame.clear()
+        if not lines:
+            return
+        
+        if color not in self._paragraph_open:
+            size = round(self.content_font_size.pt * 100)
+            if color is None:
+                def_rpr = f'<a:defRPr sz="{size}"/>'
+            else:
+                def_rpr = (f'<a:defRPr sz="{size}"><a:solidFill>'
+                           f'<a:srgbClr val="{color}"/></a:solidFill></a:defRPr>')
+            self._paragraph_open[color] = f'<a:p><a:pPr>{def_rpr}</a:pPr>'
+        paragraph_open = self._paragraph_open[color]
+        
+        # Lines with control characters are filled in afterwards through
+        # python-pptx, which encodes them
+        deferred = [i for i, line in enumerate(lines) if _CONTROL_CHARS.search(line)]
+        paragraphs = [f'{paragraph_open}<a:r><a:t>{escape(line)}</a:t></a:r></a:p>'
+                      for line in lines]
+        for i in deferred:
+            paragraphs[i] = f'{paragraph_open}</a:p>'
+        fragment = parse_xml(f'<a:txBody {nsdecls("a")}>{"".join(paragraphs)}</a:txBody>')
+        
+        txBody = text_frame._txBody
+        for p in txBody.p_lst:
+            txBody.remove(p)
+        txBody.extend(list(fragment))
+        
+        if deferred:
+            paragraph_list = text_frame.paragraphs
+            for i in deferred:
+                paragraph_list[i].text = lines[i]
+    
+    def create_title_slide(self, title: str, subtitle: str = "", 
+                          author: str = "Anirban Pal", 
+                          affiliation: str = "van Duin Group, Penn State") -> None:
+        """
+        Create professional title slide
+        
+        Args:
+            title: Presentation title
+            subtitle: Subtitle or date
+            author: Author name
+            affiliation: Institution/group
+        """
+        slide_layout = self.prs.slide_layouts[0]  # Title slide layout
+        slide = self.prs.slides.add_slide(slide_layout)
+        
+        # Title
+        self._set_title(slide.shapes.title, title, bold=True)
+        
+        # Subtitle
+        if slide.shapes.placeholders[1]:
+            subtitle_shape = slide.shapes.placeholders[1]
+            if subtitle:
+                subtitle_text = f"{subtitle}\n\n{author}\n{affiliation}"
+            else:
+                subtitle_text = f"{author}\n{affiliation}\n{datetime.now().strftime('%B %d, %Y')}"
+            
+            subtitle_shape.text = subtitle_text
+            for paragraph in subtitle_shape.text_frame.paragraphs:
+                paragraph.font.size = self.subtitle_font_size
+                paragraph.font.color.rgb = self.text_color
+    
+    def add_analysis_results_slide(self, results_file: str, 
+                                  slide_title: str = "Analysis Results") -> None:
+        """
+        Create slide from analysis results JSON
+        
+        Args:
+            results_file: Path to analysis results JSON
+            slide_title: Title for the slide
+        """
+        stat = os.stat(results_file)
+        results = _load_results_summary(str(results_file), stat.st_mtime_ns, stat.st_size)
+        
+        slide_layout = self.prs.slide_layouts[1]  # Title and content
+        slide = self.prs.slides.add_slide(slide_layout)
+        
+        # Title
+        self._set_title(slide.shapes.title, slide_title)
+        
+        # Content
+        content_shape = slide.shapes.placeholders[1]
+        text_frame = content_shape.text_frame
+        
+        # Add key findings
+        lines = []
+        if 'bonds' in results:
+            bonds = results['bonds']
+            lines.append(f"• Average bond count: {bonds['avg_count']:.1f}")
+            lines.append(f"• Average bond length: {bonds['avg_length']:.3f} Å")
+        
+        if 'energy' in results and results['energy']:
+            energy = results['energy']
+            lines.append(f"• Mean energy: {energy['mean']:.2f} eV")
+            lines.append(f"• Energy stability: ±{energy['std']:.2f} eV")
+        
+        if 'rdf' in results:
+            rdf = results['rdf']
+            lines.append(f"• RDF analysis: {rdf['frames_analyzed']} frames analyzed")
+        
+        self._set_paragraphs(text_frame, lines)
+    
+    def add_plot_slide(self, plot_file: str, title: str, 
+                      caption: str = "", layout: str = "picture") -> None:
+        """
+        Add slide with plot/figure
+        
+        Args:
+            plot_file: Path to plot image
+            title: Slide title
+            caption: Plot caption
+            layout: Slide layout type
+        """
+        if layout == "picture":
+            slide_layout = self.prs.slide_layouts[6]  # Blank slide
+        else:
+            slide_layout = self.prs.slide_layouts[1]  # Title and content
+        
+        slide = self.prs.slides.add_slide(slide_layout)
+        
+        if layout != "picture":
+            # Add title
+            self._set_title(slide.shapes.title, title)
+        
+        # Add image
+        left, top, width, height = _plot_box(layout)
+        try:
+            image = self._prepare_image(plot_file, width, height)
+        except FileNotFoundError:
+            return
+        
+        pic = slide.shapes.add_picture(image, left, top, width, height)
+        # Streams have no filename; keep the plot name as the alt text
+        pic.element.nvPicPr.cNvPr.set('descr', Path(plot_file).name)
+        
+        # Add title on picture slides
+        if layout == "picture":
+            textbox = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), 
+                                             Inches(9), Inches(0.8))
+            text_frame = textbox.text_frame
+            p = text_frame.paragraphs[0]
+            p.text = title
+            p.font.size = self.title_font_size
+            p.font.color.rgb = self.primary_color
+            p.font.bold = True
+            p.alignment = PP_ALIGN.CENTER
+        
+        # Add caption
+        if caption:
+            if layout == "picture":
+                caption_top = Inches(7.8)
+            else:
+                caption_top = Inches(7.2)
+            
+            textbox = slide.shapes.add_textbox(Inches(1), caption_top, 
+                                             Inches(8), Inches(0.5))
+            text_frame = textbox.text_frame
+            p = text_frame.paragraphs[0]
+            p.text = caption
+            p.font.size = self.caption_font_size
+            p.font.color.rgb = self.text_color
+            p.alignment = PP_ALIGN.CENTER
+
+    def _prepare_image(self, image_file: str, width, height) -> io.BytesIO:
+        """
+        Get image data sized for its placement on the slide
+        
+        Args:
+            image_file: Path to image
+            width: Placement width (EMU)
+            height: Placement height (EMU)
+            
+        Returns:
+            In-memory image stream for add_picture
+        """
+        stat = os.stat(image_file)
+        max_px = (round(width.inches * EMBED_DPI), round(height.inches * EMBED_DPI))
+        data = _load_slide_image(str(image_file), stat.st_mtime_ns, stat.st_size, max_px)
+        return io.BytesIO(data)
+    
+    def prefetch_images(self, image_files: List[str], layout: str = "picture") -> None:
+        """
+        Prepare plot images concurrently ahead of add_plot_slide
+        
+        Resampling and PNG recompression release the GIL, so a thread pool
+        overlaps them. The slides themselves must still be added one at a
+        time since python-pptx is not thread-safe.
+        
+        Args:
+            image_files: Paths to plot images
+            layout: Slide layout the images will be placed in
+        """
+        _, _, width, height = _plot_box(layout)
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(lambda f: self._prepare_image(f, width, height), image_files))
+    
+    def add_methods_slide(self, project_info: Dict) -> None:
+        """
+        Add methodology slide
+        
+        Args:
+            project_info: Dictionary with project information
+        """
+        slide_layout = self.prs.slide_layouts[1]  # Title and content
+        slide = self.prs.slides.add_slide(slide_layout)
+        
+        # Title
+        self._set_title(slide.shapes.title, "Methodology")
+        
+        # Content
+        content_shape = slide.shapes.placeholders[1]
+        text_frame = content_shape.text_frame
+        
+        methods = [
+            "• Molecular Dynamics Simulations using ReaxFF",
+            "• Force field: " + project_info.get('force_field', 'Custom ReaxFF parameters'),
+            "• Temperature: " + project_info.get('temperature', '298 K'),
+            "• Analysis performed using ASE and Probaah",
+            "• Statistical analysis over " + str(project_info.get('n_frames', 'N')) + " frames"
+        ]
+        
+        self._set_paragraphs(text_frame, methods)
+    
+    def add_conclusions_slide(self, key_findings: List[str]) -> None:
+        """
+        Add conclusions slide
+        
+        Args:
+            key_findings: List of key findings/conclusions
+        """
+        slide_layout = self.prs.slide_layouts[1]  # Title and content
+        slide = self.prs.slides.add_slide(slide_layout)
+        
+        # Title
+        self._set_title(slide.shapes.title, "Key Findings & Conclusions")
+        
+        # Content
+        content_shape = slide.shapes.placeholders[1]
+        text_frame = content_shape.text_frame
+        
+        self._set_paragraphs(text_frame, [f"• {finding}" for finding in key_findings],
+                             color=self.text_color)
+    
+    def add_next_steps_slide(self, next_steps: List[str]) -> None:
+        """
+        Add next steps slide
+        
+        Args:
+            next_steps: List of future work items
+        """
+        slide_layout = self.prs.slide_layouts[1]  # Title and content
+        slide = self.prs.slides.add_slide(slide_layout)
+        
+        # Title
+        self._set_title(slide.shapes.title, "Next Steps")
+        
+        # Content
+        content_shape = slide.shapes.placeholders[1]
+        text_frame = content_shape.text_frame
+        
+        self._set_paragraphs(text_frame, [f"• {step}" for step in next_steps],
+                             color=self.text_color)
+    
+    def save_presentation(self, filename: str,
+                          compression_level: Optional[int] = None) -> str:
+        """
+        Save the presentation
+        
+        Args:
+            filename: Output filename
+            compression_level: DEFLATE level 0-9 for the XML parts of the
+                pptx archive (default: zlib's, level 6). Use 9 for the
+                smallest file, 1 for quick throwaway decks. PNG/JPEG
+                media is stored uncompressed. Both need python-pptx's
+                package writer internals; without them the deck is
+                written by Presentation.save.
+            
+        Returns:
+            Path to saved presentation
+        """
+        output_path = Path(filename)
+        # Same members as Presentation.save, but PNG/JPEG media is stored
+        # rather than deflated a second time
+        if not _write_stored_media(self.prs.part.package, str(output_path), compression_level):
+            self.prs.save(str(output_path))
+        print(f"📊 Presentation saved: {output_path}")
+        return str(output_path)
+
+def create_weekly_update_presentation(analysis_dir: str, 
+                                    output_file: str = "weekly_update.pptx",
+                                    project_name: str = "Research Update") -> str:
+    """
+    Create automated weekly update presentation
+    
+    Args:
+        analysis_dir: Directory containing analysis results
+        output_file: Output PowerPoint file
+        project_name: Name of the project
+        
+    Returns:
+        Path to created presentation
+    """
+    generator = ProbaahPresentationGenerator()
+    
+    # Title slide
+    date_str = datetime.now().strftime("%B %d, %Y")
+    generator.create_title_slide(
+        title=project_name,
+        subtitle=f"Weekly Update - {date_str}",
+        author="Anirban Pal",
+        affiliation="van Duin Group, Penn State"
+    )
+    
+    # One directory listing instead of a stat() per expected file
+    analysis_dir = Path(analysis_dir)
+    try:
+        with os.scandir(analysis_dir) as entries:
+            available = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        available = set()
+    
+    # Analysis results slide
+    if "analysis_results.json" in available:
+        results_file = analysis_dir / "analysis_results.json"
+        generator.add_analysis_results_slide(str(results_file), "Analysis Results")
+    
+    # Plot slides
+    plot_files = {
+        "Bond Evolution": "bond_evolution.png",
+        "Radial Distribution Function": "rdf.png", 
+        "Energy Evolution": "energy_evolution.png"
+    }
+    
+    plot_files = {title: str(analysis_dir / name) for title, name in plot_files.items()
+                  if name in available}
+    generator.prefetch_images(list(plot_files.values()), layout="picture")
+    
+    for title, plot_file in plot_files.items():
+        generator.add_plot_slide(plot_file, title, layout="picture")
+    
+    # Methods slide (if project config exists)
+    config_file = analysis_dir.parent / ".probaah-config.yaml"
+    try:
+        config = _load_yaml(str(config_file), os.stat(config_file).st_mtime_ns)
+    except FileNotFoundError:
+        config = None
+    if config is not None:
+        project_info = config.get('project', {})
+        generator.add_methods_slide(project_info)
+    
+    # Conclusions (template - can be customized)
+    key_findings = [
+        "Successful molecular dynamics simulation completed",
+        "Bond analysis reveals stable molecular structure",
+        "Energy equilibration achieved within simulation timeframe",
+        "Results consistent with experimental observations"
+    ]
+    generator.add_conclusions_slide(key_findings)
+    
+    # Next steps
+    next_steps = [
+        "Extend simulation time for longer-term analysis",
+        "Investigate temperature effects on stability",
+        "Compare with alternative force field parameters",
+        "Prepare manuscript for publication"
+    ]
+    generator.add_next_steps_slide(next_steps)
+    
+    # Save presentation
+    return generator.save_presentation(output_file)
+
+def create_presentations_batch(analysis_dirs: List[str],
+                               output_dir: Optional[str] = None,
+                               max_workers: Optional[int] = None) -> List[str]:
+    """
+    Create weekly update presentations for many analysis directories
+    
+    Decks are independent, so each is built in its own worker process.
+    Each deck is titled after the project folder containing its analysis
+    directory and saved as <project>_weekly_update.pptx, or as
+    <project>_<analysis dir>_weekly_update.pptx when several analysis
+    directories would otherwise share a file name.
+    
+    Args:
+        analysis_dirs: Directories containing analysis results
+        output_dir: Directory for the decks (default: each project folder)
+        max_workers: Number of worker processes (default: CPU count)
+        
+    Returns:
+        Paths to created presentations, in input order
+        
+    Raises:
+        ValueError: If two analysis directories would still write the same file
+    """
+    project_names = []
+    targets = []
+    for analysis_dir in analysis_dirs:
+        analysis_path = Path(analysis_dir).resolve()
+        project_dir = analysis_path.parent
+        project_names.append(project_dir.name)
+        target_dir = (Path(output_dir) if output_dir else project_dir).resolve()
+        targets.append((target_dir, project_dir.name, analysis_path.name))
+    
+    # Decks that would share a file name also get their analysis dir's name
+    base_names = [(target_dir, project) for target_dir, project, _ in targets]
+    output_files = []
+    for target_dir, project, analysis in targets:
+        if base_names.count((target_dir, project)) > 1:
+            output_files.append(str(target_dir / f"{project}_{analysis}_weekly_update.pptx"))
+        else:
+            output_files.append(str(target_dir / f"{project}_weekly_update.pptx"))
+    duplicates = sorted({f for f in output_files if output_files.count(f) > 1})
+    if duplicates:
+        raise ValueError(f"Analysis directories would overwrite each other's decks: {duplicates}")
+    
+    for target_dir in {target_dir for target_dir, _, _ in targets}:
+        target_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Spawned, not forked, workers: a fork after oxipng has started its
+    # thread pool in this process can deadlock in the child
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context("spawn")) as pool:
+        return list(pool.map(create_weekly_update_presentation,
+                             analysis_dirs, output_files, project_names))
+
+# CLI interface function
+def generate_presentation_cli(analysis_dir: str, title: str = "Research Presentation",
+                            output: str = "presentation.pptx", 
+                            style: str = "weekly") -> str:
+    """
+    Command-line interface for presentation generation
+    
+    Args:
+        analysis_dir: Directory with analysis results
+        title: Presentation title
+        output: Output filename
+        style: Presentation style (weekly, conference, group_meeting)
+        
+    Returns:
+        Path to created presentation
+    """
+    if style == "weekly":
+        return create_weekly_update_presentation(analysis_dir, output, title)
+    else:
+        # Can add other styles later
+        return create_weekly_update_presentation(analysis_dir, output, title)
+
+# Example usage
+if __name__ == "__main__":
+    # Test presentation generation
+    # create_weekly_update_presentation("./analysis", "test_presentation.pptx")
+    print("🎨 PowerPoint Generator ready for Probaah!")
@@ -2,7 +2,80 @@
 # FILE: setup.py
 # ================================
 
-from setuptools import setup, find_packages
+import os
+import tempfile
+
+from setuptools import Extension, setup, find_packages
+from setuptools.command.build_ext import build_ext
+
+try:
+    from setuptools.errors import CCompilerError, ExecError, PlatformError
+except ImportError:
+    from distutils.errors import (CCompilerError, DistutilsExecError as ExecError,
+                                  DistutilsPlatformError as PlatformError)
+
+OPENMP_FLAG = "-fopenmp"
+
+# Compiled RDF kernel (optional): built when Cython is installed, otherwise
+# the analyzer falls back to its Numba/NumPy backends
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension(
+            "plugins.analysis.ase_tools._rdf_kernel",
+            ["plugins/analysis/ase_tools/_rdf_kernel.pyx"],
+            extra_compile_args=["-O3", OPENMP_FLAG],
+            extra_link_args=[OPENMP_FLAG],
+        )],
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+
+class OptionalBuildExt(build_ext):
+    """
+    Build the compiled extensions as optional extras
+    
+    OpenMP flags are dropped when the compiler can't build an OpenMP
+    program (e.g. Apple clang), and an extension that fails to compile is
+    skipped with a warning instead of failing the install.
+    """
+    
+    def build_extensions(self):
+        if not self._has_openmp():
+            print(f"⚠️  {OPENMP_FLAG} not supported by the compiler; "
+                  "building extensions single-threaded")
+            for ext in self.extensions:
+                ext.extra_compile_args = [a for a in ext.extra_compile_args if a != OPENMP_FLAG]
+                ext.extra_link_args = [a for a in ext.extra_link_args if a != OPENMP_FLAG]
+        self._skipped = set()
+        super().build_extensions()
+        # Nothing to copy or install for the skipped ones
+        self.extensions = [ext for ext in self.extensions if ext.name not in self._skipped]
+    
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError) as e:
+            print(f"⚠️  Skipping optional extension {ext.name}: {e}")
+            self._skipped.add(ext.name)
+    
+    def _has_openmp(self) -> bool:
+        """Whether the compiler can compile and link a small OpenMP program"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "openmp_probe.c")
+            with open(source, "w") as f:
+                f.write("#include <omp.h>\n"
+                        "int main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }\n")
+            try:
+                objects = self.compiler.compile([source], output_dir=tmp,
+                                                extra_postargs=[OPENMP_FLAG])
+                self.compiler.link_executable(objects, os.path.join(tmp, "openmp_probe"),
+                                              extra_postargs=[OPENMP_FLAG])
+            except (CCompilerError, ExecError, PlatformError):
+                return False
+        return True
 
 setup(
     name="probaah",
@@ -12,6 +85,8 @@ setup(
     author="Anirban Pal",
     author_email="akp6421@psu.edu",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": OptionalBuildExt},
     install_requires=[
         "click>=8.0",
         "rich>=13.0",
@@ -0,0 +1,9 @@
+# FILE: tests/conftest.py
+"""
+Make the repository root importable (plugins.*) when running pytest
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,32 @@
+# FILE: tests/test_presentation_batch.py
+"""
+Tests for batch presentation generation
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pptx")
+from pptx import Presentation
+
+from plugins.presentation.pptx_generator.research_slides import create_presentations_batch
+
+def _analysis_dir(project_dir):
+    analysis_dir = project_dir / "analysis"
+    analysis_dir.mkdir(parents=True)
+    (analysis_dir / "analysis_results.json").write_text(
+        '{"bonds": {"avg_count": 10.0, "avg_length": 1.1}, "rdf": {"frames_analyzed": 3}}')
+    return analysis_dir
+
+def test_batch_creates_missing_output_dir(tmp_path):
+    analysis_dirs = [_analysis_dir(tmp_path / name) for name in ("projA", "projB")]
+    output_dir = tmp_path / "decks" / "new"
+    
+    output_files = create_presentations_batch([str(d) for d in analysis_dirs],
+                                              output_dir=str(output_dir), max_workers=2)
+    
+    assert [Path(f).name for f in output_files] == [
+        "projA_weekly_update.pptx", "projB_weekly_update.pptx"]
+    for output_file in output_files:
+        assert len(Presentation(output_file).slides) > 0
@@ -0,0 +1,121 @@
+# FILE: tests/test_trajectory_kernels.py
+"""
+Regression tests for the trajectory analyzer's compiled paths
+Each RDF backend and the reused (Verlet) bond neighbour list are checked
+against plain ASE/NumPy references on periodic and cell-less frames
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ase")
+from ase import Atoms
+from ase.geometry import get_distances
+from ase.io import write
+from ase.neighborlist import neighbor_list
+
+from plugins.analysis.ase_tools import trajectory_analyzer as ta
+
+RMAX = 6.0
+N_BINS = 60
+BOX = 12.0
+
+def _frames(periodic: bool, n_frames: int = 12, n_atoms: int = 150,
+            step: float = 0.02, seed: int = 0):
+    """Slowly moving random frames, in a cubic periodic box or without a cell"""
+    rng = np.random.default_rng(seed)
+    numbers = rng.choice([1, 6, 8], n_atoms)
+    positions = rng.random((n_atoms, 3)) * BOX
+    frames = []
+    for _ in range(n_frames):
+        positions = positions + rng.normal(0.0, step, positions.shape)
+        if periodic:
+            frames.append(Atoms(numbers=numbers, positions=positions,
+                                cell=[BOX, BOX, BOX], pbc=True))
+        else:
+            frames.append(Atoms(numbers=numbers, positions=positions))
+    return frames
+
+@pytest.fixture(params=[True, False], ids=["periodic", "cell-less"])
+def trajectory(request, tmp_path):
+    frames = _frames(request.param)
+    path = tmp_path / "trajectory.traj"
+    write(str(path), frames)
+    return path, frames
+
+def _reference_histogram(atoms: Atoms) -> np.ndarray:
+    """Pair-distance histogram from ASE minimum-image distances"""
+    _, distances = get_distances(atoms.positions, cell=atoms.cell, pbc=atoms.pbc)
+    distances = distances[np.triu_indices(len(atoms), k=1)]
+    bin_idx = (distances[distances < RMAX] * (N_BINS / RMAX)).astype(np.int64)
+    return np.bincount(bin_idx[bin_idx < N_BINS], minlength=N_BINS)
+
+@pytest.mark.parametrize("backend", ["numpy", "numba", "cython", "cuda"])
+def test_rdf_backends_match_reference(backend, trajectory, tmp_path, monkeypatch):
+    monkeypatch.setenv("PROBAAH_RDF_BACKEND", backend)
+    if ta._rdf_backend() != backend:
+        pytest.skip(f"{backend} backend not available")
+    
+    path, frames = trajectory
+    analyzer = ta.ProbaahTrajectoryAnalyzer(str(path), str(tmp_path / "analysis"))
+    r_bins = np.linspace(0, RMAX, N_BINS + 1)
+    for atoms in frames:
+        hist = analyzer._pair_histogram(atoms.positions, atoms.cell.array, r_bins)
+        np.testing.assert_array_equal(hist, _reference_histogram(atoms))
+
+def test_cuda_backend_is_opt_in(monkeypatch):
+    monkeypatch.delenv("PROBAAH_RDF_BACKEND", raising=False)
+    assert ta._rdf_backend() != "cuda"
+
+def test_broken_cupy_falls_back(monkeypatch):
+    class BrokenCupy:
+        class cuda:
+            class runtime:
+                @staticmethod
+                def getDeviceCount():
+                    raise ImportError("libcudart.so not found")
+    
+    monkeypatch.setattr(ta, "cp", BrokenCupy)
+    monkeypatch.setenv("PROBAAH_RDF_BACKEND", "cuda")
+    ta._cuda_available.cache_clear()
+    try:
+        assert ta._rdf_backend() != "cuda"
+    finally:
+        ta._cuda_available.cache_clear()
+
+def test_reused_neighbour_list_matches_reference(trajectory, tmp_path):
+    if ta.neighbour_list is None:
+        pytest.skip("matscipy not installed")
+    
+    path, frames = trajectory
+    calls = []
+    search = ta.neighbour_list
+    
+    def counting_search(*args, **kwargs):
+        calls.append(1)
+        return search(*args, **kwargs)
+    
+    analyzer = ta.ProbaahTrajectoryAnalyzer(str(path), str(tmp_path / "analysis"))
+    try:
+        ta.neighbour_list = counting_search
+        bonds = analyzer.analyze_bonds(max_workers=1)
+    finally:
+        ta.neighbour_list = search
+    
+    # Small steps: the list is reused for at least some frames
+    assert 0 < len(calls) < len(frames)
+    
+    cutoffs = ta.covalent_radii[frames[0].numbers] * 1.2 + ta.NEIGHBOR_SKIN
+    for index, atoms in enumerate(frames):
+        i_idx, j_idx, distances = neighbor_list('ijd', atoms, cutoffs)
+        expected = np.sort(distances[i_idx < j_idx])
+        start, end = bonds['frame_ptr'][index], bonds['frame_ptr'][index + 1]
+        assert bonds['counts'][index] == len(expected)
+        np.testing.assert_allclose(np.sort(bonds['lengths'][start:end]), expected, rtol=1e-6)
+
+def test_non_ulm_traj_energies_fall_back(tmp_path):
+    # Old-format (pre-ULM) or foreign .traj files can't be read by the
+    # header reader; callers then parse frames instead
+    path = tmp_path / "old.traj"
+    path.write_bytes(b"PickleTrajectory" + bytes(64))
+    assert ta._read_energies(path) is None